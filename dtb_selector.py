@@ -9,13 +9,28 @@ Multi-language support with English/Portuguese
 
 import os
 import sys
-import shutil
-import json
 import logging
-import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Indisponível fora do Linux/Unix
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Opcional: parser JSON acelerado
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None  # Opcional: parser SIMD com acesso preguiçoso
+
+if os.name == 'nt':
+    os.system('')  # Habilita sequências ANSI no console do Windows
+
 # ============================================================================
 # Configurações Globais e Constantes
 # ============================================================================
@@ -25,6 +40,11 @@ class Config:
     CLEANUP_PATTERNS = ["*.dtb", "*.ini", "*.orig", "*.tony"]
     CONSOLES_DIR = "consoles"
     CONFIG_FILE = "consoles.json"
+    # ioctl FICLONE (Linux 4.5+): clone por metadados em btrfs/xfs/bcachefs
+    FICLONE = 0x40049409
+    COPY_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+    # Primeiro byte de s(im)/y(es); basta para aceitar a confirmação
+    CONFIRMATION_YES = frozenset({'s', 'y'})
     SUPPORTED_LANGUAGES = {
         "en": {"name": "English", "file": None},
         "cn": {"name": "Chinese", "file": ".cn"},
@@ -32,6 +52,15 @@ class Config:
     }
     DEFAULT_LANGUAGE = "en"
 
+# Caminhos resolvidos uma única vez na importação
+SCRIPT_DIR = Path(__file__).parent
+WORK_DIR = Path.cwd()
+CONFIG_PATH = SCRIPT_DIR / Config.CONFIG_FILE
+
+# Capacidades do terminal detectadas uma única vez
+STDOUT_IS_TTY = sys.stdout.isatty()
+STDIN_IS_TTY = sys.stdin.isatty()
+
 # ============================================================================
 # Classes de Exceção Personalizadas
 # ============================================================================
@@ -54,11 +83,22 @@ class FileOperationError(DTBSelectorError):
 
 def setup_logging(level: str = "INFO") -> None:
     """Configura o sistema de logging."""
+    from logging.handlers import MemoryHandler
+
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # O arquivo só é aberto no primeiro flush e recebe registros em lote;
+    # WARNING+ descarrega na hora e logging.shutdown() drena o restante
+    file_handler = logging.FileHandler('dtb_selector.log', delay=True)
+    file_handler.setFormatter(logging.Formatter(log_format))
+    buffered_handler = MemoryHandler(capacity=64,
+                                     flushLevel=logging.WARNING,
+                                     target=file_handler)
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler('dtb_selector.log'),
+            buffered_handler,
             logging.StreamHandler()
         ]
     )
@@ -72,6 +112,7 @@ class AppState:
     def __init__(self):
         self.operating_system: Optional[str] = None
         self.consoles: List[Dict[str, Any]] = []
+        self.consoles_by_brand: Dict[str, List[Dict[str, Any]]] = {}
         self.brands: List[str] = []
         self.selected_brand: Optional[str] = None
         self.selected_console: Optional[Dict[str, Any]] = None
@@ -89,52 +130,64 @@ class AppState:
 
 class Messages:
     """Centraliza todas as mensagens do sistema."""
-    
+
+    # Conteúdo estático construído uma única vez na criação da classe
+    HEADER = [
+        "============================================================",
+        "       DTB SELECTOR TOOL - R36 Device Configuration",
+        "   Original creator: LCDYK - Modified by: Leonardo Bruno",
+        "============================================================"
+    ]
+
+    # Forma já concatenada do cabeçalho para as telas de escrita única
+    HEADER_TEXT = "\n".join(HEADER)
+
+    INSTRUCTIONS = {
+        "title": "IMPORTANT INSTRUCTIONS / INSTRUÇÕES IMPORTANTES",
+        "items": [
+            "* Support only for listed consoles / Suporte apenas para consoles listados",
+            "* DO NOT USE original DTB files! / Não utilize arquivos DTB originais!",
+            "* Use the identification tool / Use a ferramenta de identificação:",
+            "  https://lcdyk0517.github.io/dtbTools.html"
+        ]
+    }
+
+    SUCCESS_NEXT_STEPS = [
+        "* Boot your device with the new configuration / Inicialize o dispositivo",
+        "* Report any issues encountered / Relate problemas encontrados",
+        "  Github: https://github.com/souza-lb/dtb-selector"
+    ]
+
+    ERRORS = {
+        "file_not_found": "consoles.json file not found! / Arquivo consoles.json não encontrado!",
+        "check_file": "Make sure the file is in the script directory. / Certifique-se que o arquivo está no diretório.",
+        "json_error": "Error reading consoles.json: {}",
+        "invalid_structure": "Invalid structure in consoles.json: {}",
+        "operation_cancelled": "Operation cancelled by user. / Operação cancelada pelo usuário.",
+        "invalid_input": "Please enter a valid number. / Por favor digite um número válido.",
+        "invalid_number": "Invalid number. Try again. / Número inválido. Tente novamente.",
+        "unexpected_error": "Unexpected error: {}"
+    }
+
     @staticmethod
     def get_header() -> List[str]:
-        return [
-            "============================================================",
-            "       DTB SELECTOR TOOL - R36 Device Configuration",
-            "   Original creator: LCDYK - Modified by: Leonardo Bruno",
-            "============================================================"
-        ]
-    
+        return Messages.HEADER
+
     @staticmethod
     def get_instructions() -> Dict[str, Any]:
-        return {
-            "title": "IMPORTANT INSTRUCTIONS / INSTRUÇÕES IMPORTANTES",
-            "items": [
-                "* Support only for listed consoles / Suporte apenas para consoles listados",
-                "* DO NOT USE original DTB files! / Não utilize arquivos DTB originais!",
-                "* Use the identification tool / Use a ferramenta de identificação:",
-                "  https://lcdyk0517.github.io/dtbTools.html"
-            ]
-        }
-    
+        return Messages.INSTRUCTIONS
+
     @staticmethod
     def get_success(console_name: str) -> Dict[str, Any]:
         return {
             "title": "OPERATION COMPLETED SUCCESSFULLY / OPERAÇÃO CONCLUÍDA COM SUCESSO",
             "console": f"Console: {console_name}",
-            "next_steps": [
-                "* Boot your device with the new configuration / Inicialize o dispositivo",
-                "* Report any issues encountered / Relate problemas encontrados",
-                "  Github: https://github.com/souza-lb/dtb-selector"
-            ]
+            "next_steps": Messages.SUCCESS_NEXT_STEPS
         }
-    
+
     @staticmethod
     def get_errors() -> Dict[str, str]:
-        return {
-            "file_not_found": "consoles.json file not found! / Arquivo consoles.json não encontrado!",
-            "check_file": "Make sure the file is in the script directory. / Certifique-se que o arquivo está no diretório.",
-            "json_error": "Error reading consoles.json: {}",
-            "invalid_structure": "Invalid structure in consoles.json: {}",
-            "operation_cancelled": "Operation cancelled by user. / Operação cancelada pelo usuário.",
-            "invalid_input": "Please enter a valid number. / Por favor digite um número válido.",
-            "invalid_number": "Invalid number. Try again. / Número inválido. Tente novamente.",
-            "unexpected_error": "Unexpected error: {}"
-        }
+        return Messages.ERRORS
 
 # ============================================================================
 # Utilitários do Sistema
@@ -153,15 +206,20 @@ class SystemUtils:
     @staticmethod
     def clear_screen() -> None:
         """Limpa a tela do terminal."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not STDOUT_IS_TTY:
+            return
+        try:
+            # Escape ANSI direto evita o fork/exec de 'cls'/'clear'
+            sys.stdout.write('\033[2J\033[H')
+            sys.stdout.flush()
+        except (AttributeError, OSError):
+            # sys.stdout substituído ou fechado: escreve direto no fd 1
+            os.write(1, b'\033[2J\033[H')
     
     @staticmethod
     def wait_for_enter() -> None:
         """Aguarda o usuário pressionar Enter."""
-        try:
-            input("\nPress Enter to continue... / Pressione Enter para continuar... ")
-        except (KeyboardInterrupt, EOFError):
-            raise DTBSelectorError(Messages.get_errors()["operation_cancelled"])
+        InputHandler.read_input("\nPress Enter to continue... / Pressione Enter para continuar... ")
 
 # ============================================================================
 # Utilitários de Entrada do Usuário
@@ -174,28 +232,42 @@ class InputHandler:
     def read_input(prompt: str) -> str:
         """Lê a entrada do usuário, tratando interrupções."""
         try:
-            return input(prompt).strip()
-        except (KeyboardInterrupt, EOFError):
+            # Escrever o prompt e ler a linha direto do stdin evita a
+            # máquina de prompt do input() no caminho quente dos menus
+            sys.stdout.write(prompt)
+            if STDIN_IS_TTY or STDOUT_IS_TTY:
+                # Com entrada e saída redirecionadas ninguém espera pelo
+                # prompt; deixa o stdout agrupar as escritas. Qualquer
+                # terminal vivo ainda recebe o flush imediato.
+                sys.stdout.flush()
+            line = sys.stdin.readline()
+        except KeyboardInterrupt:
+            raise DTBSelectorError(Messages.get_errors()["operation_cancelled"])
+        if not line:  # EOF (Ctrl+D ou fim da entrada redirecionada)
             raise DTBSelectorError(Messages.get_errors()["operation_cancelled"])
+        return line.strip()
     
     @staticmethod
     def get_integer_input(prompt: str, min_val: int = None, max_val: int = None) -> int:
         """Lê um número inteiro com validação."""
+        # Invariantes do laço resolvidas uma única vez
+        read_input = InputHandler.read_input
+        invalid_input = Messages.get_errors()["invalid_input"]
+
         while True:
             try:
-                value = InputHandler.read_input(prompt)
-                num = int(value)
-                
+                num = int(read_input(prompt))
+
                 if min_val is not None and num < min_val:
                     print(f"Value must be at least {min_val}")
                     continue
                 if max_val is not None and num > max_val:
                     print(f"Value must be at most {max_val}")
                     continue
-                    
+
                 return num
             except ValueError:
-                print(Messages.get_errors()["invalid_input"])
+                print(invalid_input)
 
 # ============================================================================
 # Gerenciador de Configuração
@@ -203,22 +275,91 @@ class InputHandler:
 
 class ConfigManager:
     """Gerencia o carregamento da configuração."""
-    
+
+    @staticmethod
+    def _read_cache(cache_path: Path,
+                    source_stat: os.stat_result) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """Lê o cache binário se ainda corresponder ao consoles.json."""
+        import pickle
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if (cached["mtime_ns"] == source_stat.st_mtime_ns and
+                    cached["size"] == source_stat.st_size):
+                return cached["consoles"], cached["brands"]
+        except Exception:
+            pass  # Cache ausente ou inválido: reanalisa o JSON
+        return None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, source_stat: os.stat_result,
+                     consoles: List[Dict[str, Any]], brands: List[str]) -> None:
+        """Grava o cache binário pré-analisado (melhor esforço)."""
+        import pickle
+        payload = {
+            "mtime_ns": source_stat.st_mtime_ns,
+            "size": source_stat.st_size,
+            "consoles": consoles,
+            "brands": brands,
+        }
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(payload, f, pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logging.debug(f"Could not write config cache {cache_path}: {e}")
+
     @staticmethod
     def load_configuration() -> Tuple[List[Dict[str, Any]], List[str]]:
         """Carrega a configuração de consoles do arquivo JSON."""
-        config_path = Path(__file__).parent / Config.CONFIG_FILE
+        config_path = CONFIG_PATH
+        errors = Messages.get_errors()
+        try:
+            source_stat = config_path.stat()
+        except FileNotFoundError:
+            raise ConfigError(errors["file_not_found"] + "\n" + errors["check_file"])
+
+        # Cache binário evita reanalisar o JSON a cada execução
+        cache_path = config_path.with_name(Config.CONFIG_FILE + ".cache")
+        cached = ConfigManager._read_cache(cache_path, source_stat)
+        if cached is not None:
+            return cached
+
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            return config["consoles"], config["brands"]
+            data = config_path.read_bytes()
+            if simdjson:
+                # Acesso on-demand: materializa apenas as duas chaves usadas
+                doc = simdjson.Parser().parse(data)
+                consoles, brands = doc["consoles"].as_list(), doc["brands"].as_list()
+            elif orjson:
+                # orjson decodifica direto dos bytes e é ~5x mais rápido
+                config = orjson.loads(data)
+                consoles, brands = config["consoles"], config["brands"]
+            else:
+                import json
+                config = json.loads(data)
+                consoles, brands = config["consoles"], config["brands"]
         except FileNotFoundError:
-            raise ConfigError(Messages.get_errors()["file_not_found"] + "\n" + 
-                             Messages.get_errors()["check_file"])
-        except json.JSONDecodeError as e:
-            raise ConfigError(Messages.get_errors()["json_error"].format(e))
+            raise ConfigError(errors["file_not_found"] + "\n" + errors["check_file"])
+        except ValueError as e:
+            # json.JSONDecodeError e orjson.JSONDecodeError derivam de ValueError
+            raise ConfigError(errors["json_error"].format(e))
         except KeyError as e:
-            raise ConfigError(Messages.get_errors()["invalid_structure"].format(e))
+            raise ConfigError(errors["invalid_structure"].format(e))
+
+        ConfigManager._write_cache(cache_path, source_stat, consoles, brands)
+        return consoles, brands
+
+    @staticmethod
+    def index_by_brand(consoles: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Indexa os consoles por marca em uma única passada."""
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for console in consoles:
+            for entry in console["brand_entries"]:
+                index.setdefault(entry["brand"], []).append({
+                    "console_config": console,
+                    "display_name": entry["display_name"]
+                })
+        return index
 
 # ============================================================================
 # Gerenciador de Arquivos
@@ -230,49 +371,120 @@ class FileManager:
     @staticmethod
     def clean_destination_directory() -> None:
         """Limpa o diretório atual de arquivos anteriores."""
+        import fnmatch
+        import re
         logging.info("Cleaning destination directory...")
-        current_dir = Path.cwd()
-        
-        for pattern in Config.CLEANUP_PATTERNS:
-            for file in current_dir.glob(pattern):
+        current_dir = WORK_DIR
+
+        # Todos os padrões de limpeza fundidos em uma única regex compilada
+        matches_cleanup = re.compile("|".join(
+            fnmatch.translate(pattern) for pattern in Config.CLEANUP_PATTERNS)).match
+
+        # Uma única passada de os.scandir cobre todos os padrões de limpeza
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if not matches_cleanup(entry.name):
+                    continue
                 try:
-                    file.unlink()
-                    logging.info(f"   Removed: {file}")
+                    os.unlink(entry.path)
+                    logging.info(f"   Removed: {entry.path}")
                 except OSError as e:
-                    logging.warning(f"   Could not remove {file}: {e}")
+                    logging.warning(f"   Could not remove {entry.path}: {e}")
         
-        # Remove BMPs directory if exists
-        bmp_dir = current_dir / "BMPs"
-        if bmp_dir.exists():
-            try:
-                shutil.rmtree(bmp_dir)
-                logging.info("   Removed: BMPs/")
-            except OSError as e:
-                logging.warning(f"   Could not remove BMPs/: {e}")
+        # Remove BMPs directory if exists (EAFP: tentar e tratar a ausência)
+        try:
+            import shutil
+            shutil.rmtree(current_dir / "BMPs")
+            logging.info("   Removed: BMPs/")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logging.warning(f"   Could not remove BMPs/: {e}")
     
+    @staticmethod
+    def _copy_file_descriptors(src_fd: int, dst_fd: int) -> None:
+        """Copia dados entre descritores, preferindo clones/cópias no kernel."""
+        # Tentativa 1: reflink (clone por metadados em btrfs/xfs/bcachefs)
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_fd, Config.FICLONE, src_fd)
+                return
+            except OSError:
+                pass  # Filesystem sem suporte a reflink
+
+        # Tentativa 2: copy_file_range mantém os bytes no kernel
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(src_fd, dst_fd, Config.COPY_CHUNK_SIZE):
+                    pass
+                return
+            except OSError:
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+
+        # Tentativa 3: sendfile também copia sem passar pelo userspace
+        if hasattr(os, 'sendfile'):
+            try:
+                while os.sendfile(dst_fd, src_fd, None, Config.COPY_CHUNK_SIZE):
+                    pass
+                return
+            except OSError:
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+
+        # Fallback: loop read/write em blocos de 1 MiB
+        while True:
+            chunk = os.read(src_fd, Config.COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            while chunk:
+                written = os.write(dst_fd, chunk)
+                chunk = chunk[written:]
+
+    @staticmethod
+    def _fast_copy_file(source: Path, destination: Path) -> None:
+        """Copia um arquivo preservando metadados, como shutil.copy2."""
+        import shutil
+        # Converte Path -> str uma vez; cada syscall abaixo reusa a forma crua
+        src = os.fspath(source)
+        dst = os.fspath(destination)
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                FileManager._copy_file_descriptors(src_fd, dst_fd)
+            finally:
+                os.close(dst_fd)
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    # A origem não será relida: devolve suas páginas ao cache
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass  # Conselho ao kernel; falhar não afeta a cópia
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+
     @staticmethod
     def recursive_copy(source: Path, destination: Path) -> bool:
         """Copia arquivos/diretórios recursivamente."""
+        import shutil
         try:
             if not source.exists():
                 logging.error(f"Source does not exist: {source}")
                 return False
-                
+
             if source.is_dir():
-                # Usar shutil.copytree com dirs_exist_ok se disponível (Python 3.8+)
-                if sys.version_info >= (3, 8):
-                    shutil.copytree(source, destination, dirs_exist_ok=True)
-                else:
-                    for item in source.iterdir():
-                        item_dest = destination / item.name
-                        if item.is_dir():
-                            FileManager.recursive_copy(item, item_dest)
-                        else:
-                            shutil.copy2(str(item), str(item_dest))
+                shutil.copytree(source, destination, dirs_exist_ok=True,
+                                copy_function=FileManager._fast_copy_file)
                 return True
             else:
                 destination.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, destination)
+                FileManager._fast_copy_file(source, destination)
                 return True
         except Exception as e:
             logging.error(f"Error copying {source} to {destination}: {e}")
@@ -287,29 +499,50 @@ class FileManager:
         logging.info(f"Starting copy: {display_name}")
         
         # Caminho base para os consoles
-        base_path = Path(__file__).parent / Config.CONSOLES_DIR
-        
+        base_path = SCRIPT_DIR / Config.CONSOLES_DIR
+
+        # Um único os.scandir responde pelas entradas de primeiro nível
+        try:
+            with os.scandir(base_path) as entries:
+                available = {entry.name for entry in entries}
+        except FileNotFoundError:
+            logging.error(f"Directory not found: {base_path}")
+            return False
+
         # Copiar console principal
         console_source = base_path / real_name
-        if not console_source.exists():
+        if real_name not in available:
             logging.error(f"Directory not found: {console_source}")
             return False
         
         print(f"   Copying console: {real_name}")
-        if not FileManager.recursive_copy(console_source, Path.cwd()):
+        if not FileManager.recursive_copy(console_source, WORK_DIR):
             return False
         
-        # Copiar recursos extras
-        print("   Copying extra resources...")
-        for resource in selected_console["extra_sources"]:
-            resource_source = base_path / resource
-            if resource_source.exists():
-                print(f"      {resource}")
-                if not FileManager.recursive_copy(resource_source, Path.cwd()):
-                    logging.warning(f"Failed to copy {resource}")
-            else:
-                logging.warning(f"Extra resource not found: {resource}")
-        
+        # Copiar recursos extras em paralelo (carga limitada por I/O)
+        extra_sources = selected_console["extra_sources"]
+        if extra_sources:
+            print("   Copying extra resources...")
+            from concurrent.futures import ThreadPoolExecutor
+
+            pending: Dict[Any, str] = {}
+            with ThreadPoolExecutor(max_workers=min(4, len(extra_sources))) as executor:
+                for resource in extra_sources:
+                    if resource.split('/', 1)[0] not in available:
+                        logging.warning(f"Extra resource not found: {resource}")
+                        continue
+                    resource_source = base_path / resource
+                    if resource_source.exists():
+                        print(f"      {resource}")
+                        future = executor.submit(FileManager.recursive_copy,
+                                                 resource_source, WORK_DIR)
+                        pending[future] = resource
+                    else:
+                        logging.warning(f"Extra resource not found: {resource}")
+                for future, resource in pending.items():
+                    if not future.result():
+                        logging.warning(f"Failed to copy {resource}")
+
         return True
 
 # ============================================================================
@@ -331,38 +564,34 @@ class Menu:
     def display(self) -> Any:
         """Exibe o menu e retorna a escolha do usuário."""
         SystemUtils.clear_screen()
-        
-        # Mostrar cabeçalho
-        for line in Messages.get_header():
-            print(line)
-        
-        print(f"\n{self.title}")
-        print("=" * 60)
-        
-        # Exibir itens
-        for i, item in enumerate(self.items, 1):
-            print(f"  {i}. {item.text}")
-        
-        print(f"  0. Exit / Sair")
-        print()
-        
+
+        # Montar a tela completa e emitir em uma única escrita
+        lines = [Messages.HEADER_TEXT]
+        lines.append(f"\n{self.title}")
+        lines.append("=" * 60)
+        lines.extend(f"  {i}. {item.text}" for i, item in enumerate(self.items, 1))
+        lines.append("  0. Exit / Sair")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+
         return self.get_choice()
     
     def get_choice(self) -> Any:
         """Obtém a escolha do usuário."""
+        errors = Messages.get_errors()
         while True:
             try:
                 choice = InputHandler.read_input("Enter choice / Digite sua escolha: ")
                 if choice == '0':
                     return None
-                
+
                 idx = int(choice) - 1
                 if 0 <= idx < len(self.items):
                     return self.items[idx].value
                 else:
-                    print(Messages.get_errors()["invalid_number"])
+                    print(errors["invalid_number"])
             except ValueError:
-                print(Messages.get_errors()["invalid_input"])
+                print(errors["invalid_input"])
 
 # ============================================================================
 # Gerenciador de Interface do Usuário
@@ -375,21 +604,17 @@ class UserInterface:
     def show_introduction() -> None:
         """Exibe a introdução e instruções."""
         SystemUtils.clear_screen()
-        
-        # Cabeçalho
-        for line in Messages.get_header():
-            print(line)
-        
-        print("\nWELCOME TO DTB SELECTOR / BEM-VINDO AO SELETOR DTB")
-        print("=" * 60)
-        print()
-        
+
+        # Montar a tela completa e emitir em uma única escrita
         instructions = Messages.get_instructions()
-        print(instructions["title"])
-        for item in instructions["items"]:
-            print(f"  {item}")
-        
-        print("\nTip: Press 'q' anytime to exit / Pressione 'q' para sair")
+        lines = [Messages.HEADER_TEXT]
+        lines.append("\nWELCOME TO DTB SELECTOR / BEM-VINDO AO SELETOR DTB")
+        lines.append("=" * 60)
+        lines.append("")
+        lines.append(instructions["title"])
+        lines.extend(f"  {item}" for item in instructions["items"])
+        lines.append("\nTip: Press 'q' anytime to exit / Pressione 'q' para sair")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         try:
             response = InputHandler.read_input("\nPress Enter to continue / Pressione Enter: ")
@@ -407,17 +632,11 @@ class UserInterface:
         return menu.display()
     
     @staticmethod
-    def console_menu(consoles: List[Dict[str, Any]], brand: str) -> Optional[Dict[str, Any]]:
+    def console_menu(consoles_by_brand: Dict[str, List[Dict[str, Any]]],
+                     brand: str) -> Optional[Dict[str, Any]]:
         """Menu de seleção de console para uma marca específica."""
-        brand_consoles = []
-        for console in consoles:
-            for entry in console["brand_entries"]:
-                if entry["brand"] == brand:
-                    brand_consoles.append({
-                        "console_config": console,
-                        "display_name": entry["display_name"]
-                    })
-        
+        brand_consoles = consoles_by_brand.get(brand, [])
+
         if not brand_consoles:
             print(f"No consoles found for: {brand}")
             SystemUtils.wait_for_enter()
@@ -452,11 +671,14 @@ class UserInterface:
     def apply_language(language: str) -> None:
         """Aplica o idioma selecionado."""
         logging.info("Configuring language...")
-        
+
         # Remove existing language files
-        current_dir = Path.cwd()
+        current_dir = WORK_DIR
+        # Um único os.scandir responde todos os testes de existência
+        with os.scandir(current_dir) as entries:
+            existing = {entry.name for entry in entries}
         for code, info in Config.SUPPORTED_LANGUAGES.items():
-            if info["file"] and (current_dir / info["file"]).exists():
+            if info["file"] and info["file"] in existing:
                 try:
                     (current_dir / info["file"]).unlink()
                     logging.info(f"   Removed: {info['file']}")
@@ -468,7 +690,9 @@ class UserInterface:
             lang_info = Config.SUPPORTED_LANGUAGES[language]
             if lang_info["file"]:
                 try:
-                    (current_dir / lang_info["file"]).touch()
+                    # O marcador é vazio: um os.open com O_CREAT basta
+                    os.close(os.open(current_dir / lang_info["file"],
+                                     os.O_CREAT | os.O_WRONLY, 0o644))
                     print(f"   Language set: {lang_info['name']}")
                 except Exception as e:
                     logging.error(f"   Error creating {lang_info['file']} file: {e}")
@@ -482,6 +706,7 @@ class UserInterface:
 def main():
     """Função principal do programa."""
     # Configurar parsing de argumentos
+    import argparse
     parser = argparse.ArgumentParser(description='DTB Selector Tool')
     parser.add_argument('--lang', choices=['en', 'cn', 'br'], 
                        help='Set initial language')
@@ -507,6 +732,7 @@ def main():
         
         # Carregar configuração
         state.consoles, state.brands = ConfigManager.load_configuration()
+        state.consoles_by_brand = ConfigManager.index_by_brand(state.consoles)
         
         # Modo silencioso (não implementado completamente, apenas exemplo)
         if args.silent:
@@ -526,7 +752,7 @@ def main():
         state.selected_brand = brand
         
         # Seleção de console
-        console = UserInterface.console_menu(state.consoles, brand)
+        console = UserInterface.console_menu(state.consoles_by_brand, brand)
         if not console:
             print("\nNo console selected. / Nenhum console selecionado.")
             return
@@ -536,9 +762,10 @@ def main():
         print(f"\nConsole selected: {console['display_name']}")
         confirmation = InputHandler.read_input(
             "Continue with copy? (y/N) / Continuar com a cópia? (s/N): "
-        ).strip().lower()
-        
-        if confirmation not in ['s', 'sim', 'y', 'yes']:
+        )
+
+        # read_input já remove espaços; o primeiro byte decide
+        if confirmation[:1].lower() not in Config.CONFIRMATION_YES:
             print("\nOperation cancelled by user. / Operação cancelada pelo usuário.")
             return
         
@@ -555,35 +782,32 @@ def main():
             UserInterface.apply_language(language)
             state.selected_language = language
         
-        # Mensagem de sucesso
+        # Mensagem de sucesso (tela montada e emitida em uma única escrita)
         SystemUtils.clear_screen()
-        for line in Messages.get_header():
-            print(line)
-        
-        print("\nOperation Completed! / Operação Concluída!")
-        print("=" * 60)
-        
         success_msg = Messages.get_success(console['display_name'])
-        print(f"\n{success_msg['title']}")
-        print(success_msg['console'])
-        
+        lines = [Messages.HEADER_TEXT]
+        lines.append("\nOperation Completed! / Operação Concluída!")
+        lines.append("=" * 60)
+        lines.append(f"\n{success_msg['title']}")
+        lines.append(success_msg['console'])
+
         # Mostrar idioma aplicado
         if state.selected_language:
             lang_name = Config.SUPPORTED_LANGUAGES[state.selected_language]['name']
-            print(f"Language: {lang_name}")
+            lines.append(f"Language: {lang_name}")
         else:
             # Verificar se há arquivo de idioma existente
             for code, info in Config.SUPPORTED_LANGUAGES.items():
                 if info["file"] and Path(info["file"]).exists():
-                    print(f"Language: {info['name']} (kept)")
+                    lines.append(f"Language: {info['name']} (kept)")
                     break
             else:
-                print("Language: English (default)")
-        
-        print("\nNEXT STEPS / PRÓXIMOS PASSOS:")
-        for step in success_msg['next_steps']:
-            print(f"  {step}")
-        
+                lines.append("Language: English (default)")
+
+        lines.append("\nNEXT STEPS / PRÓXIMOS PASSOS:")
+        lines.extend(f"  {step}" for step in success_msg['next_steps'])
+        sys.stdout.write("\n".join(lines) + "\n")
+
         SystemUtils.wait_for_enter()
         
     except DTBSelectorError as e: